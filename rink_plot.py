@@ -1,28 +1,387 @@
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.figure import Figure
+from matplotlib.path import Path
 from matplotlib.transforms import Affine2D
 import numpy as np
 
 
-def arc_patch(center, width, height, theta1, theta2, resolution=50, **kwargs):
+# dimensions of the rink in feet, in the NHL coordinate system (center ice is at 0, 0)
+RinkDims = namedtuple("RinkDims", ["half_length", "half_width", "corner_radius", "goal_line_x", "blue_line_x"])
+RINK_DIMS = RinkDims(half_length=100, half_width=42.5, corner_radius=28, goal_line_x=89, blue_line_x=25)
+
+_HALF_LENGTH, _HALF_WIDTH, _CORNER_R, _GOAL_X, _BLUE_X = RINK_DIMS
+
+# faceoff circles have a 15' radius
+# offensive zone dots are 20' from the goal line with 44' in between
+_CIRCLE_R = 15
+_FACEOFF_X = _GOAL_X - 20
+_FACEOFF_Y = 22
+
+# 5'7" between hashmarks, 5'7" = 67", divide by 12 to get feet, divide by 2 to get half on each side
+_BETWEEN_HM = 67 / 24
+
+# hashmarks start at the edge of the circle
+_HASHMARK_EDGE = (_CIRCLE_R**2 - _BETWEEN_HM**2)**.5
+
+# ref half-circle has a 10' radius
+_REF_R = 10
+
+# crease is 8' wide, extends 4'6" out from the goal line, then ends in an ellipse of width 2'
+_CREASE_Y = 4
+_CREASE_X = _GOAL_X - 4.5
+_CREASE_ARC = 2
+
+# posts are 3' from center
+_POST_Y = 3
+
+# nets
+# depth is 40" with 18" radius (NHL rulebook says 20", but supposed to be 18")
+# width of posts is 19/8", total width is 88"
+# almost certainly incorrect, but close enough
+_NET_DEPTH = 40 / 12
+_NET_R = 18 / 12
+_NET_CURVE_X = _GOAL_X + 11 / 6
+_NET_CURVE_Y = _POST_Y - 5 / 6
+_POST_WIDTH = 19 / 8 / 12
+_NET_HALF_WIDTH = 88 / 24
+
+# restricted zone goes from 8' from the post to 11' from the post
+_RZ_Y_IN = _POST_Y + 8
+_RZ_Y_OUT = _POST_Y + 11
+
+# goal lines are 11' from the end boards and meet the boards where they curl in the corners
+# distance from center of corner circle to goal line = 28' - 11'
+# distance from center of ice (on y-axis) to center of corner circle = 42.5 - 28
+_END_BOARD_Y = np.sqrt(_CORNER_R ** 2 - (_GOAL_X - (_HALF_LENGTH - _CORNER_R)) ** 2) + (_HALF_WIDTH - _CORNER_R)
+
+
+# cached geometry of the rink markings; each field is a tuple
+# paths: ((facecolor, edgecolor, zorder), tuple of Paths)
+# arcs: (center, width, height, theta1, theta2, color, zorder)
+# segs: ((color, zorder), read-only (N, 2, 2) array of line segments)
+_RinkGeometry = namedtuple("_RinkGeometry", ["paths", "arcs", "segs"])
+
+
+@lru_cache(maxsize=64)
+def _unit_arc(theta1, theta2, resolution):
+    """
+    Return the cosines and sines of evenly spaced angles (in degrees) from theta1 to theta2.
+
+    The arrays are cached and shared between calls, so they're marked read-only.
+    """
+
+    theta = np.linspace(np.radians(theta1), np.radians(theta2), resolution)
+    cos_t = np.cos(theta)
+    sin_t = np.sin(theta)
+    cos_t.setflags(write=False)
+    sin_t.setflags(write=False)
+
+    return cos_t, sin_t
+
+
+def _arc_vertices(center_x, center_y, width, height, cos_t, sin_t):
+    """
+    Return an (N, 2) array of points along an ellipse, given the cosines and sines of the angles.
+    """
+
+    points = np.empty((cos_t.shape[0], 2))
+    points[:, 0] = width * cos_t + center_x
+    points[:, 1] = height * sin_t + center_y
+
+    return points
+
+
+def _offset_segments(segs, offsets):
+    """
+    Return an (N * M, 2, 2) array of line segments, with all N segments moved by each of the M offsets.
+    """
+
+    return (segs[None, :, :, :] + offsets[:, None, None, :]).reshape(-1, 2, 2)
+
+
+def arc_patch(center, width, height, theta1, theta2, resolution=None, **kwargs):
     """
     Return matplotlib patch for a filled-in half-ellipse.
 
     Courtesy of https://stackoverflow.com/questions/30642391/how-to-draw-a-filled-arc-in-matplotlib
+
+    resolution is the number of points used along the arc.  If None, it's scaled with the size of the arc (8 points
+    per foot of the larger radius, with a minimum of 12) so small arcs aren't drawn with more points than can be seen
+    and large ones don't look faceted.
     """
 
+    if resolution is None:
+        resolution = max(12, int(8 * max(width, height)))
+
     # generate the points
-    theta = np.linspace(np.radians(theta1), np.radians(theta2), resolution)
-    points = np.vstack((width * np.cos(theta) + center[0],
-                        height * np.sin(theta) + center[1]))
+    cos_t, sin_t = _unit_arc(theta1, theta2, resolution)
+    points = _arc_vertices(center[0], center[1], width, height, cos_t, sin_t)
 
     # build the polygon and add it to the axes
-    poly = mpatches.Polygon(points.T, closed=True, **kwargs)
+    poly = mpatches.Polygon(points, closed=True, **kwargs)
 
     return poly
 
 
-def draw_rink(is_horizontal=True, x_range=None, y_range=None, rink_length=None):
+def _rects_path(rects):
+    """
+    Return a single matplotlib Path made up of rectangles.
+
+    Args:
+        rects: list of tuples
+            Each rectangle as (x, y, width, height), the same as matplotlib's Rectangle patch.
+
+    Returns:
+        matplotlib Path.
+    """
+
+    x, y, width, height = np.asarray(rects, dtype=float).T
+    polys = np.stack((np.stack((x, y), axis=-1),
+                      np.stack((x + width, y), axis=-1),
+                      np.stack((x + width, y + height), axis=-1),
+                      np.stack((x, y + height), axis=-1)), axis=1)
+
+    return _readonly_path(Path.make_compound_path_from_polys(polys))
+
+
+def _polygon_path(xy):
+    """
+    Return a closed matplotlib Path through the given (N, 2) points.
+    """
+
+    xy = np.asarray(xy, dtype=float)
+
+    # the last vertex of a closed path is ignored; it's replaced with the code to close the polygon
+    return Path(np.concatenate((xy, xy[:1])), closed=True, readonly=True)
+
+
+@lru_cache(maxsize=None)
+def _build_rink_geometry():
+    """
+    Build the geometry of the rink markings in the NHL coordinate system.
+
+    The rink is the same every time, so the geometry is built once and cached.  Only paths, segment arrays and arc
+    parameters are kept (artists can't be shared between axes); draw_rink_on builds new artists from them.
+
+    Returns:
+        tuple of _RinkGeometry.
+            Geometry centered on the red line, and geometry for the right half of the rink (to be mirrored for the
+            left half).
+    """
+
+    # shapes are kept as paths grouped by (facecolor, edgecolor, zorder)
+    paths = defaultdict(list)
+    # arcs are kept as (center, width, height, theta1, theta2, color, zorder)
+    arcs = []
+    # straight lines are kept as segments grouped by (color, zorder)
+    segs = defaultdict(list)
+
+    # red line
+    # 1' in width
+    # all other red lines are 2" in width, but will be drawn thicker
+    paths[("red", "red", 0)].append(_rects_path([(-0.5, -_HALF_WIDTH, 1, 2 * _HALF_WIDTH)]))
+
+    # blue lines
+    # 1' in width
+    # both are drawn as one path
+    paths[("blue", "blue", 0)].append(_rects_path([(_BLUE_X, -_HALF_WIDTH, 1, 2 * _HALF_WIDTH),
+                                                   (-_BLUE_X, -_HALF_WIDTH, -1, 2 * _HALF_WIDTH)]))
+
+    # center faceoff
+    paths[("blue", "blue", 0)].append(Path.circle((0, 0), .5, readonly=True))
+
+    # center circle
+    paths[("none", "red", 0)].append(Path.circle((0, 0), _CIRCLE_R, readonly=True))
+
+    # ref half-circle
+    arcs.append(((0, -_HALF_WIDTH), 2 * _REF_R, 2 * _REF_R, 0, 180, "red", 0))
+
+    # side boards
+    segs[("black", 2)].append([[_HALF_LENGTH - _CORNER_R, _HALF_WIDTH], [_CORNER_R - _HALF_LENGTH, _HALF_WIDTH]])
+    segs[("black", 2)].append([[_HALF_LENGTH - _CORNER_R, -_HALF_WIDTH], [_CORNER_R - _HALF_LENGTH, -_HALF_WIDTH]])
+
+    # everything else is symmetric about the red line, so only the right half is built
+    # draw_rink_on mirrors it to draw the left half
+    right_paths = defaultdict(list)
+    right_arcs = []
+    right_segs = defaultdict(list)
+
+    for y in (-_FACEOFF_Y, _FACEOFF_Y):
+        # faceoff dots
+        # 2' diameter
+        right_paths[("red", "red", 0)].append(Path.circle((_FACEOFF_X, y), 1, readonly=True))
+
+        # neutral zone dots
+        # 5' from the bluelines
+        right_paths[("red", "red", 0)].append(Path.circle((_BLUE_X - 5, y), 1, readonly=True))
+
+        # faceoff circles
+        right_paths[("none", "red", 0)].append(Path.circle((_FACEOFF_X, y), _CIRCLE_R, readonly=True))
+
+    # faceoff lines and hashmarks
+    # every faceoff circle gets the same set of segments relative to its center; this is the set to its right
+    # faceoff lines are 4' long, 3' apart
+    circle_segs = np.array([
+        [[2, 1.75], [6, 1.75]],
+        [[2, -1.75], [6, -1.75]],
+        [[2, 1.75], [2, 4.75]],
+        [[2, -1.75], [2, -4.75]],
+        [[_BETWEEN_HM, -_HASHMARK_EDGE], [_BETWEEN_HM, -_HASHMARK_EDGE - 2]],
+        [[_BETWEEN_HM, _HASHMARK_EDGE], [_BETWEEN_HM, _HASHMARK_EDGE + 2]],
+    ])
+
+    # segments are needed on the right of the circles at both ends; the mirror adds the ones on the left
+    circle_xs, circle_ys = np.meshgrid((-_FACEOFF_X, _FACEOFF_X), (-_FACEOFF_Y, _FACEOFF_Y))
+    circle_centers = np.stack((circle_xs.ravel(), circle_ys.ravel()), axis=-1)
+    right_segs[("red", 0)].extend(_offset_segments(circle_segs, circle_centers))
+
+    # nets
+    right_paths[("grey", "grey", 2)].append(Path.circle((_NET_CURVE_X, _NET_CURVE_Y), _NET_R, readonly=True))
+    right_paths[("grey", "grey", 2)].append(Path.circle((_NET_CURVE_X, -_NET_CURVE_Y), _NET_R, readonly=True))
+    right_paths[("grey", "grey", 2)].append(_polygon_path(
+        [[_GOAL_X, _POST_Y + _POST_WIDTH], [_NET_CURVE_X, _NET_HALF_WIDTH], [_GOAL_X + _NET_DEPTH, _NET_CURVE_Y],
+         [_GOAL_X + _NET_DEPTH, -_NET_CURVE_Y], [_NET_CURVE_X, -_NET_HALF_WIDTH], [_GOAL_X, -_POST_Y - _POST_WIDTH]]))
+
+    # creases
+    # rectangle and ellipse are drawn as one path
+    crease = _readonly_path(Path.make_compound_path(
+        _rects_path([(_GOAL_X, -_CREASE_Y, _CREASE_X - _GOAL_X, 2 * _CREASE_Y)]),
+        _polygon_path(_arc_vertices(_CREASE_X, 0, _CREASE_ARC, _CREASE_Y, *_unit_arc(90, 270, 16))),
+    ))
+    right_paths[("lightblue", "lightblue", -1)].append(crease)
+
+    # outline of crease
+    right_segs[("red", 1)].append([[_GOAL_X, -_CREASE_Y], [_CREASE_X, -_CREASE_Y]])
+    right_segs[("red", 1)].append([[_GOAL_X, _CREASE_Y], [_CREASE_X, _CREASE_Y]])
+    right_arcs.append(((_CREASE_X, 0), 2 * _CREASE_ARC, 2 * _CREASE_Y, 90, 270, "red", 1))
+
+    # restricted zone
+    right_segs[("red", 0)].append([[_GOAL_X, -_RZ_Y_IN], [_HALF_LENGTH, -_RZ_Y_OUT]])
+    right_segs[("red", 0)].append([[_GOAL_X, _RZ_Y_IN], [_HALF_LENGTH, _RZ_Y_OUT]])
+
+    # curves at end of boards
+    # both corners are drawn as one path
+    corners = _readonly_path(Path.make_compound_path(
+        Path(_arc_vertices(_HALF_LENGTH - _CORNER_R, _HALF_WIDTH - _CORNER_R, _CORNER_R, _CORNER_R,
+                           *_unit_arc(0, 90, 24))),
+        Path(_arc_vertices(_HALF_LENGTH - _CORNER_R, _CORNER_R - _HALF_WIDTH, _CORNER_R, _CORNER_R,
+                           *_unit_arc(270, 360, 24))),
+    ))
+    right_paths[("none", "black", 2)].append(corners)
+
+    # end boards
+    right_segs[("black", 2)].append([[_HALF_LENGTH, _HALF_WIDTH - _CORNER_R], [_HALF_LENGTH, _CORNER_R - _HALF_WIDTH]])
+
+    # goal lines
+    right_segs[("red", 1)].append([[_GOAL_X, -_END_BOARD_Y], [_GOAL_X, _END_BOARD_Y]])
+
+    return _freeze_geometry(paths, arcs, segs), _freeze_geometry(right_paths, right_arcs, right_segs)
+
+
+def _readonly_path(path):
+    """
+    Return a read-only copy of a matplotlib Path.
+    """
+
+    if path.readonly:
+        return path
+
+    return Path(path.vertices.copy(), None if path.codes is None else path.codes.copy(), readonly=True)
+
+
+def _freeze_geometry(paths, arcs, segs):
+    """
+    Pack the pieces of the rink into a _RinkGeometry that's safe to cache.
+    """
+
+    frozen_segs = []
+    for style, style_segs in segs.items():
+        style_segs = np.asarray(style_segs, dtype=float)
+        style_segs.setflags(write=False)
+        frozen_segs.append((style, style_segs))
+
+    # artists handed to users share these paths, so they're made read-only too
+    frozen_paths = tuple((style, tuple(_readonly_path(path) for path in style_paths))
+                         for style, style_paths in paths.items())
+
+    return _RinkGeometry(paths=frozen_paths,
+                         arcs=tuple(arcs),
+                         segs=tuple(frozen_segs))
+
+
+def draw_rink_on(ax, is_horizontal=True):
+    """
+    Add the rink markings to an existing matplotlib Axes.
+
+    The rink's geometry is cached, so it's only built once no matter how many plots it's drawn on.  Axis limits,
+    aspect and ticks are left alone.
+
+    For animations, the rink only needs to be rendered once.  Draw the canvas, save the background with
+    background = fig.canvas.copy_from_bbox(ax.bbox), then for each frame:
+        fig.canvas.restore_region(background)
+        ax.draw_artist(artist)
+        fig.canvas.blit(ax.bbox)
+    where artist is created with animated=True.
+
+    Args:
+        ax: matplotlib Axes
+            Axes to draw the rink on.
+
+        is_horizontal: bool; default=True
+            Indicates whether to draw the rink horizontally (left and right as end boards) or vertically (top and
+            bottom as end boards).
+
+    Returns:
+        matplotlib Axes.
+            Axes for the rink plot.
+    """
+
+    # rotate everything 90 degrees if displaying rink vertically
+    trans = Affine2D().rotate_deg(0 if is_horizontal else 90) + ax.transData
+
+    # the left half of the rink is the right half flipped over the red line
+    mirror = Affine2D().scale(-1, 1) + trans
+
+    center, half = _build_rink_geometry()
+
+    _add_rink_artists(ax, center, trans)
+    _add_rink_artists(ax, half, trans)
+    _add_rink_artists(ax, half, mirror)
+
+    return ax
+
+
+def _add_rink_artists(ax, geometry, trans):
+    """
+    Build artists from cached rink geometry and add them to the axes, combining the pieces into as few artists as
+    possible.
+    """
+
+    # paths sharing a style are drawn as a single collection
+    for (facecolor, edgecolor, zorder), style_paths in geometry.paths:
+        collection = PathCollection(style_paths, facecolors=facecolor, edgecolors=edgecolor, zorder=zorder)
+        collection.set_transform(trans)
+        ax.add_collection(collection)
+
+    # arcs are unfilled and can't be drawn through a collection
+    for xy, width, height, theta1, theta2, color, zorder in geometry.arcs:
+        arc = mpatches.Arc(xy, width, height, theta1=theta1, theta2=theta2, color=color, zorder=zorder)
+        arc.set_transform(trans)
+        ax.add_patch(arc)
+
+    # straight lines go in one collection per colour and zorder rather than a Line2D each
+    for (color, zorder), style_segs in geometry.segs:
+        collection = LineCollection(style_segs, colors=color, capstyle="projecting", zorder=zorder)
+        collection.set_transform(trans)
+        ax.add_collection(collection)
+
+
+def draw_rink(is_horizontal=True, x_range=None, y_range=None, rink_length=None, ax=None, use_pyplot=True):
     """
     Draw a plot of an NHL ice surface.
 
@@ -67,186 +426,81 @@ def draw_rink(is_horizontal=True, x_range=None, y_range=None, rink_length=None):
             If None, will use default of 14 if using a full horizontal rink or 8 otherwise.
             Width is set automatically based on rink_length and dimensions used.
 
+            Ignored if ax is provided.
+
+        ax: matplotlib Axes; default=None
+            Axes to draw the rink on.  If None, a new figure is created.
+
+        use_pyplot: bool; default=True
+            Indicates whether a new figure is created through pyplot (and becomes the current figure) or as a
+            standalone matplotlib Figure.
+
+            A standalone Figure skips pyplot's global state, which is faster when drawing many rinks and safe to do
+            off the main thread, but has to be attached to a canvas (or saved with savefig) by the caller.
+
     Returns:
         matplotlib Axes.
             Axes for the rink plot.
     """
 
     if x_range in ("half", "ozone"):
-        x_range = [0 if x_range == "half" else 25, 100]
+        x_range = [0 if x_range == "half" else _BLUE_X, _HALF_LENGTH]
     elif isinstance(x_range, (int, float)):
-        x_range = [x_range, 100]
+        x_range = [x_range, _HALF_LENGTH]
     elif isinstance(x_range, list) and x_range:
-        x_range.append(100)
+        x_range.append(_HALF_LENGTH)
         x_range = x_range[:2]
     else:
-        x_range = [-100, 100]
+        x_range = [-_HALF_LENGTH, _HALF_LENGTH]
 
     if x_range[0] > x_range[1]:
         x_range = x_range[::-1]
 
-    x_range = [max(-100, x_range[0]), min(100, x_range[1])]
+    x_range = [max(-_HALF_LENGTH, x_range[0]), min(_HALF_LENGTH, x_range[1])]
 
-    if x_range[0] >= 100:
-        x_range = [-100, 100]
+    if x_range[0] >= _HALF_LENGTH:
+        x_range = [-_HALF_LENGTH, _HALF_LENGTH]
 
     if y_range == "half":
-        y_range = [0, 42.5]
+        y_range = [0, _HALF_WIDTH]
     elif isinstance(y_range, (int, float)):
-        y_range = [y_range, 42.5]
+        y_range = [y_range, _HALF_WIDTH]
     elif isinstance(y_range, list) and y_range:
-        y_range.append(42.5)
+        y_range.append(_HALF_WIDTH)
         y_range = y_range[:2]
     else:
-        y_range = [-42.5, 42.5]
+        y_range = [-_HALF_WIDTH, _HALF_WIDTH]
 
     if y_range[0] > y_range[1]:
         y_range = y_range[::-1]
 
-    y_range = [max(-42.5, y_range[0]), min(100, y_range[1])]
+    y_range = [max(-_HALF_WIDTH, y_range[0]), min(_HALF_WIDTH, y_range[1])]
 
-    if y_range[0] >= 42.5:
-        y_range = [-42.5, 42.5]
+    if y_range[0] >= _HALF_WIDTH:
+        y_range = [-_HALF_WIDTH, _HALF_WIDTH]
 
     delta_x = x_range[1] - x_range[0]
     delta_y = y_range[1] - y_range[0]
-    if rink_length is None:
-        rink_length = 14 if is_horizontal and delta_x == 200 else 8
+    if ax is None:
+        if rink_length is None:
+            rink_length = 14 if is_horizontal and delta_x == 2 * _HALF_LENGTH else 8
 
-    length = rink_length
-    width = rink_length * delta_y / delta_x
-    if not is_horizontal:
-        length, width = width, length
-    plt.figure(figsize=(length, width))
-
-    ax = plt.gca()
-    ax.set_aspect("equal")
+        length = rink_length
+        width = rink_length * delta_y / delta_x
+        if not is_horizontal:
+            length, width = width, length
 
-    patches = []
-
-    # red line
-    # 1' in width
-    # all other red lines are 2" in width, but will be drawn thicker
-    patches.append(mpatches.Rectangle((-0.5, -42.5), 1, 85, color="red", zorder=0))
-
-    # center faceoff
-    patches.append(mpatches.Circle((0, 0), .5, color="blue", fill=True, zorder=0))
+        if use_pyplot:
+            plt.figure(figsize=(length, width))
+            ax = plt.gca()
+        else:
+            ax = Figure(figsize=(length, width)).add_subplot(1, 1, 1)
 
-    # center circle
-    patches.append(mpatches.Circle((0, 0), 15, color="red", fill=False, zorder=0))
-
-    # ref half-circle
-    # 10' radius
-    patches.append(mpatches.Arc((0, -42.5), 20, 20, theta1=0, theta2=180, color="red", zorder=0))
-
-    # 5'7" between, 5'7" = 67", divide by 12 to get feet, divide by 2 to get half on each side
-    between_hashmarks = 67 / 24
-
-    # edge of the circle
-    hashmark_edge = (15**2 - between_hashmarks**2)**.5
-
-    for side in (-1, 1):
-        # blue lines
-        # 1' in width
-        # neutral zone is 50', half on each side = 25
-        patches.append(mpatches.Rectangle((25 * side, -42.5), side, 85, color="blue", zorder=0))
-
-        for y in (-22, 22):
-            # faceoff dots
-            # 2' diameter
-            # offensive zone dots are 20' from the goal line with 44' in between
-            patches.append(mpatches.Circle((69 * side, y), 1, color="red", fill=True, zorder=0))
-
-            # neutral zone dots
-            # 5' from the bluelines (25 - 5 = 20), 44' in between
-            patches.append(mpatches.Circle((20 * side, y), 1, color="red", fill=True, zorder=0))
-
-            # faceoff circles
-            # 15' radius
-            patches.append(mpatches.Circle((69 * side, y), 15, color="red", fill=False, zorder=0))
-
-            for circle_side in (-1, 1):
-                # faceoff lines
-                # 4' length, 3' width
-                ax.plot((69 * side * circle_side + 2 * side, 69 * circle_side * side + 6 * side), (y + 1.75, y + 1.75),
-                        "red", zorder=0)
-                ax.plot((69 * side * circle_side + 2 * side, 69 * circle_side * side + 6 * side), (y - 1.75, y - 1.75),
-                        "red", zorder=0)
-                ax.plot((69 * side * circle_side + 2 * side, 69 * circle_side * side + 2 * side), (y + 1.75, y + 4.75),
-                        "red", zorder=0)
-                ax.plot((69 * side * circle_side + 2 * side, 69 * circle_side * side + 2 * side), (y - 1.75, y - 4.75),
-                        "red", zorder=0)
-
-                # hashmarks
-                ax.plot((69 * side * circle_side + between_hashmarks * side,
-                         69 * side * circle_side + between_hashmarks * side),
-                        (y - hashmark_edge, y - hashmark_edge - 2),
-                        "red", zorder=0)
-                ax.plot((69 * side * circle_side + between_hashmarks * side,
-                         69 * side * circle_side + between_hashmarks * side),
-                        (y + hashmark_edge, y + hashmark_edge + 2),
-                        "red", zorder=0)
-
-        # nets
-        # depth is 40" with 18" radius (NHL rulebook says 20", but supposed to be 18")
-        # width of posts is 19/8", total width is 88"
-        # almost certainly incorrect, but close enough
-        patches.append(mpatches.Circle(((89 + 11/6) * side, 3 - 5/6), 18/12, color="grey", zorder=2))
-        patches.append(mpatches.Circle(((89 + 11/6) * side, 5/6 - 3), 18/12, color="grey", zorder=2))
-        patches.append(mpatches.Polygon(
-            [[89 * side, 3 + 19 / 8 / 12], [(89 + 11/6) * side, 88 / 24], [(89 + 40 / 12) * side, 3 - 5/6],
-             [(89 + 40 / 12) * side, 5 / 6 - 3], [(89 + 11 / 6) * side, -88 / 24], [89 * side, -3 - 19 / 8 / 12]],
-            color="grey", zorder=2))
-
-        # creases
-        # rectangle extends 4'6" out, then ellipse of width 2'
-        patches.append(mpatches.Rectangle((89*side, -4), 4.5*-side, 8, color="lightblue", zorder=-1))
-        patches.append(arc_patch((84.5*side, 0), 2, 4, 270-180*side, 270, fill=True, color="lightblue", zorder=-1))
-
-        # outline of crease
-        ax.plot((89*side, 84.5*side), (-4, -4), "red", zorder=1)
-        ax.plot((89*side, 84.5*side), (4, 4), "red", zorder=1)
-        patches.append(mpatches.Arc((84.5*side, 0), 4, 8, theta1=90*side, theta2=270*side, color="red", zorder=1))
-
-        # restricted zone
-        # 8' from the post to 11' from the post (posts are 3' from center)
-        ax.plot((89*side, 100*side), (-11, -14), "red", zorder=0)
-        ax.plot((89*side, 100*side), (11, 14), "red", zorder=0)
-
-        # curves at end of boards
-        # arc of a circle with 28' radius
-        patches.append(mpatches.Arc(((100 - 28) * side, 42.5 - 28), 56, 56,
-                                    theta1=45 - 45 * side, theta2=135 - 45 * side,
-                                    color="black", zorder=2))
-        patches.append(mpatches.Arc(((100 - 28) * side, -42.5 + 28), 56, 56,
-                                    theta1=225 + 45 * side, theta2=135 - 135 * side,
-                                    color="black", zorder=2))
-
-        # side boards
-        ax.plot((100 - 28, 28 - 100), (42.5 * side, 42.5 * side), "black", zorder=2)
-        # end boards
-        ax.plot((100 * side, 100 * side), (42.5 - 28, 28 - 42.5), "black", zorder=2)
-
-        # goal lines
-        # 11' from end boards
-        # boards curl in arc of circle with 28' radius
-        # distance from center of circle to side boards = 28'
-        # distance from center of circle to goal line = 28' - 11'
-        # distance from center of ice (on y-axis) to center of circle = 42.5 - 28
-        end_board_y = np.sqrt(28 ** 2 - (28 - 11) ** 2) + (42.5 - 28)
-        ax.plot((89 * side, 89 * side), (-end_board_y, end_board_y), "red", zorder=1)
+    ax.set_aspect("equal")
 
     ax.tick_params(axis="both", which="both", bottom=False, left=False, labelbottom=False, labelleft=False)
 
-    # rotate everything 90 degrees if displaying rink vertically
-    trans = Affine2D().rotate_deg(0 if is_horizontal else 90) + ax.transData
-
-    for patch in patches:
-        patch.set_transform(trans)
-        ax.add_patch(patch)
-
-    for line in ax.lines:
-        line.set_transform(trans)
+    draw_rink_on(ax, is_horizontal)
 
     if not is_horizontal:
         old = ax.axis()